@@ -0,0 +1,19 @@
+"""Gunicorn config for NetworkIQ.
+
+Every hot route is dominated by Tavily/Gemini HTTP calls, so a single
+gevent worker with many greenlets serves concurrent enrichments without
+an asyncio rewrite — the shared requests.Session multiplexes across
+greenlets once sockets are monkey-patched.
+
+Run: USE_GEVENT=1 gunicorn -c gunicorn_conf.py networkiq:app
+"""
+
+import os
+
+os.environ.setdefault('USE_GEVENT', '1')
+
+bind = "127.0.0.1:5000"
+worker_class = "gevent"
+workers = 1
+worker_connections = 100
+timeout = 120
@@ -2,114 +2,301 @@
 """
 NetworkIQ - LinkedIn Network Analyzer
 Run: python networkiq.py
+Production: USE_GEVENT=1 gunicorn -c gunicorn_conf.py networkiq:app
 
-Requirements: pip install flask requests
+Requirements: pip install flask requests orjson
+Optional: pip install pyahocorasick (faster categorization on large imports)
+          pip install flask-compress (gzip for API responses)
+          pip install gunicorn gevent (concurrent requests in production)
 """
 
 import os
+
+# Under gunicorn's gevent worker, sockets must be monkey-patched before
+# anything else imports them (see gunicorn_conf.py)
+if os.environ.get('USE_GEVENT'):
+    from gevent import monkey
+    monkey.patch_all()
+
+import io
 import json
 import csv
 import time
 import re
+import hashlib
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from flask import Flask, render_template_string, request, jsonify
+import orjson
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
 
 app = Flask(__name__)
+if Compress is not None:
+    Compress(app)
 
 # ============ CONFIGURATION ============
 DATA_FILE = Path(__file__).parent / "networkiq_data.json"
+# Append-only log of per-connection updates; folded into DATA_FILE on
+# compaction so single enrichments don't rewrite the whole snapshot
+MUTATIONS_FILE = DATA_FILE.with_suffix('.log.jsonl')
+
+# Single-slot id -> connection index, keyed on the loaded data object so
+# routes that look up specific ids avoid a linear scan per lookup. The
+# cache keeps a reference to the data object itself, so identity can't be
+# confused by CPython reusing a freed object's address.
+_INDEX_CACHE = {'data': None, 'index': {}}
+
+def _index(data):
+    if _INDEX_CACHE['data'] is not data:
+        _INDEX_CACHE['data'] = data
+        _INDEX_CACHE['index'] = {c["id"]: c for c in data["connections"]}
+    return _INDEX_CACHE['index']
 
 def load_data():
     if DATA_FILE.exists():
-        return json.loads(DATA_FILE.read_text())
-    return {"connections": [], "api_keys": {"tavily": "", "gemini": ""}}
+        data = orjson.loads(DATA_FILE.read_bytes())
+    else:
+        data = {"connections": [], "api_keys": {"tavily": "", "gemini": ""}}
+
+    # Replay logged updates on top of the snapshot
+    if MUTATIONS_FILE.exists():
+        by_id = _index(data)
+        for line in MUTATIONS_FILE.read_bytes().splitlines():
+            if not line:
+                continue
+            op = orjson.loads(line)
+            conn = by_id.get(op.get("id"))
+            if conn:
+                conn["blurb"] = op.get("blurb")
+                conn["enrichedAt"] = op.get("enrichedAt")
+    return data
 
 def save_data(data):
-    DATA_FILE.write_text(json.dumps(data, indent=2))
+    # Write to a temp file and rename so a crash mid-write can't corrupt
+    # the data file. The snapshot supersedes any logged updates.
+    tmp = DATA_FILE.with_suffix('.json.tmp')
+    tmp.write_bytes(orjson.dumps(data))
+    os.replace(tmp, DATA_FILE)
+    MUTATIONS_FILE.unlink(missing_ok=True)
+
+def append_mutations(ops):
+    """Log per-connection updates instead of rewriting the full snapshot."""
+    with MUTATIONS_FILE.open('ab') as f:
+        f.write(b''.join(orjson.dumps(op) + b'\n' for op in ops))
+
+def compact_if_needed(data):
+    """Fold the log into a fresh snapshot once it grows past ~10% of it."""
+    if (MUTATIONS_FILE.exists() and DATA_FILE.exists()
+            and MUTATIONS_FILE.stat().st_size > DATA_FILE.stat().st_size // 10):
+        save_data(data)
 
 # ============ CSV PARSING ============
-def parse_linkedin_csv(file_path):
-    """Parse LinkedIn Connections.csv, handling the Notes preamble."""
-    with open(file_path, 'r', encoding='utf-8-sig') as f:
-        lines = f.readlines()
-    
-    # Find header row (skip LinkedIn's Notes preamble)
-    header_idx = 0
-    for i, line in enumerate(lines):
-        if 'first name' in line.lower() and 'last name' in line.lower():
-            header_idx = i
-            break
-    
+def parse_linkedin_csv(text_stream, prior_categories=None):
+    """Parse a LinkedIn Connections.csv text stream, handling the Notes preamble.
+
+    prior_categories maps (firstName, lastName, position) -> category from a
+    previous import, so unchanged rows skip re-categorization on re-upload.
+    """
+    prior_categories = prior_categories or {}
     connections = []
-    reader = csv.DictReader(lines[header_idx:])
-    
+
+    reader = csv.reader(text_stream)
+
+    # Find header row (skip LinkedIn's Notes preamble). The preamble is a
+    # few lines at most, so give up after 50 rows instead of scanning a
+    # whole headerless file
+    header = None
+    for row in itertools.islice(reader, 50):
+        lowered = [cell.lower().strip() for cell in row]
+        if 'first name' in lowered and 'last name' in lowered:
+            header = lowered
+            break
+    if header is None:
+        return connections
+
+    # Resolve column offsets once so the row loop is pure indexing
+    col = {name: i for i, name in enumerate(header)}
+    indices = tuple(col.get(name, -1) for name in (
+        'first name', 'last name', 'email address', 'company',
+        'position', 'url', 'connected on'))
+    width = len(header)
+    base_ts = int(time.time() * 1000)
+
     for i, row in enumerate(reader):
-        # Normalize keys to lowercase
-        row = {k.lower().strip(): v for k, v in row.items()}
-        
+        if len(row) < width:
+            row = row + [''] * (width - len(row))
+        fn, ln, email, company, position, url, connected = (
+            row[j] if j >= 0 else '' for j in indices)
+
+        if not (fn or ln):
+            continue
+
         conn = {
-            "id": f"conn_{i}_{int(time.time()*1000)}",
-            "firstName": row.get('first name', ''),
-            "lastName": row.get('last name', ''),
-            "email": row.get('email address', ''),
-            "company": row.get('company', ''),
-            "position": row.get('position', ''),
-            "url": row.get('url', ''),
-            "connectedOn": row.get('connected on', ''),
+            "id": f"conn_{i}_{base_ts}",
+            "firstName": fn,
+            "lastName": ln,
+            "email": email,
+            "company": company,
+            "position": position,
+            "url": url,
+            "connectedOn": connected,
             "blurb": None,
             "enrichedAt": None,
             "category": None
         }
-        
-        if conn["firstName"] or conn["lastName"]:
-            conn["category"] = categorize_connection(conn)
-            connections.append(conn)
-    
+        cached = prior_categories.get((fn, ln, position))
+        conn["category"] = cached if cached is not None else categorize_connection(conn)
+        connections.append(conn)
+
     return connections
 
+# Categories in priority order: (name, title prefixes, keywords). The table
+# drives both the Aho-Corasick automaton (single O(len) pass over the title,
+# used when pyahocorasick is installed) and the per-category regex fallback.
+# 'founder' as a substring also covers 'co-founder'/'cofounder'.
+_CATEGORIES = [
+    ('Founders', (), ('founder', 'owner')),
+    ('Executives', ('ceo', 'cto', 'cfo', 'coo', 'cmo', 'cio'), ('chief',)),
+    ('Leadership', ('vp',), ('vice president', 'director', 'head of')),
+    ('Recruiting', (), ('recruit', 'talent', 'hr', 'human resource', 'people ops')),
+    ('Investors', (), ('investor', 'partner', 'vc', 'venture', 'capital', 'angel')),
+    ('Engineering', (), ('engineer', 'developer', 'software', 'swe', 'sde', 'programmer', 'architect')),
+    ('Product', (), ('product', 'pm', 'program manager')),
+    ('Design', (), ('design', 'ux', 'ui', 'creative')),
+    ('Sales', (), ('sales', 'account', 'business dev', 'bd')),
+    ('Marketing', (), ('market', 'growth', 'brand', 'content', 'seo', 'social')),
+    ('Consulting', (), ('consult', 'advisor', 'strateg')),
+    ('Students', (), ('student', 'intern', 'university', 'college', 'phd', 'research')),
+    ('Data', (), ('analy', 'data', 'scientist')),
+    ('Finance', (), ('finance', 'accounting', 'controller')),
+    ('Legal', (), ('legal', 'counsel', 'attorney', 'lawyer')),
+    ('Operations', (), ('operat', 'admin', 'office', 'assistant')),
+]
+
+# Fallback: one precompiled pattern per category, searched in table order so
+# precedence matches the automaton path exactly (a single union regex would
+# return the leftmost match in the title, not the highest-priority category).
+# No re.IGNORECASE: the input is lowercased before matching and every
+# keyword in the table is lowercase, so the engine can skip caseless tables
+_CAT_RES = [
+    (name, re.compile('|'.join([f'^{p}' for p in prefixes] + [re.escape(k) for k in keywords])))
+    for name, prefixes, keywords in _CATEGORIES
+]
+
+# Prefix checks stay outside the automaton since they're anchored to the start.
+_CAT_PREFIXES = [(priority, name, prefixes)
+                 for priority, (name, prefixes, _) in enumerate(_CATEGORIES) if prefixes]
+
+if ahocorasick is not None:
+    _CAT_AUTOMATON = ahocorasick.Automaton()
+    for priority, (name, _, keywords) in enumerate(_CATEGORIES):
+        for keyword in keywords:
+            _CAT_AUTOMATON.add_word(keyword, (priority, name))
+    _CAT_AUTOMATON.make_automaton()
+else:
+    _CAT_AUTOMATON = None
+
 def categorize_connection(conn):
     """Auto-categorize based on job title."""
     position = (conn.get('position') or '').lower()
-    
-    if re.search(r'founder|co-founder|cofounder|owner', position, re.I):
-        return 'Founders'
-    if re.search(r'^ceo|^cto|^cfo|^coo|^cmo|^cio|chief', position, re.I):
-        return 'Executives'
-    if re.search(r'^vp|vice president|director|head of', position, re.I):
-        return 'Leadership'
-    if re.search(r'recruit|talent|hr|human resource|people ops', position, re.I):
-        return 'Recruiting'
-    if re.search(r'investor|partner|vc|venture|capital|angel', position, re.I):
-        return 'Investors'
-    if re.search(r'engineer|developer|software|swe|sde|programmer|architect', position, re.I):
-        return 'Engineering'
-    if re.search(r'product|pm|program manager', position, re.I):
-        return 'Product'
-    if re.search(r'design|ux|ui|creative', position, re.I):
-        return 'Design'
-    if re.search(r'sales|account|business dev|bd', position, re.I):
-        return 'Sales'
-    if re.search(r'market|growth|brand|content|seo|social', position, re.I):
-        return 'Marketing'
-    if re.search(r'consult|advisor|strateg', position, re.I):
-        return 'Consulting'
-    if re.search(r'student|intern|university|college|phd|research', position, re.I):
-        return 'Students'
-    if re.search(r'analy|data|scientist', position, re.I):
-        return 'Data'
-    if re.search(r'finance|accounting|controller', position, re.I):
-        return 'Finance'
-    if re.search(r'legal|counsel|attorney|lawyer', position, re.I):
-        return 'Legal'
-    if re.search(r'operat|admin|office|assistant', position, re.I):
-        return 'Operations'
-    return 'Other'
+
+    if _CAT_AUTOMATON is None:
+        for name, pattern in _CAT_RES:
+            if pattern.search(position):
+                return name
+        return 'Other'
+
+    # Walk every match and keep the highest-priority (lowest index) category,
+    # matching the precedence of the original regex cascade.
+    best = len(_CATEGORIES)
+    category = 'Other'
+    for priority, name, prefixes in _CAT_PREFIXES:
+        if priority < best and position.startswith(prefixes):
+            best, category = priority, name
+    for _, (priority, name) in _CAT_AUTOMATON.iter(position):
+        if priority < best:
+            best, category = priority, name
+            if best == 0:
+                break
+    return category
 
 # ============ API FUNCTIONS ============
+# Shared session: reuses TCP/TLS connections across API calls and retries
+# transient upstream errors instead of failing the whole enrichment.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    # allowed_methods must include POST explicitly: urllib3's default set
+    # excludes it, and every Tavily/Gemini call here is a POST
+    max_retries=Retry(total=3, backoff_factor=1, status_forcelist=[429, 502, 503],
+                      allowed_methods=frozenset({'POST'}))
+))
+
+class TokenBucket:
+    """Thread-safe token bucket for client-side rate limiting."""
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+# Gemini free tier allows ~15 requests per minute
+_GEMINI_BUCKET = TokenBucket(rate=15 / 60, capacity=15)
+
+def _build_query(conn):
+    """Build the web search query for a connection: name, position, company."""
+    name = f"{conn['firstName']} {conn['lastName']}".strip()
+    parts = [name] if name else []
+    position = conn.get('position')
+    if position:
+        parts.append(position)
+    company = conn.get('company')
+    if company:
+        parts.append(company)
+    return ' '.join(parts)
+
+# Tavily results barely change month to month, so re-uploads and retried
+# enrichments reuse them instead of paying for the same search twice
+_CACHE_DIR = DATA_FILE.parent / ".cache"
+_TAVILY_CACHE_TTL = 30 * 86400
+
+@lru_cache(maxsize=2048)
 def search_tavily(query, api_key):
-    """Search using Tavily API."""
-    response = requests.post(
+    """Search using Tavily API, with in-process and on-disk caching."""
+    cache_path = _CACHE_DIR / f"{hashlib.sha1(query.encode()).hexdigest()}.json"
+    if cache_path.exists() and cache_path.stat().st_mtime > time.time() - _TAVILY_CACHE_TTL:
+        return orjson.loads(cache_path.read_bytes())
+
+    response = _SESSION.post(
         'https://api.tavily.com/search',
         json={
             'api_key': api_key,
@@ -122,24 +309,41 @@ def search_tavily(query, api_key):
         timeout=30
     )
     response.raise_for_status()
-    return response.json()
+    result = response.json()
 
-def generate_blurb(search_results, person_name, api_key):
-    """Generate a professional blurb using Gemini."""
-    results = search_results.get('results', [])
-    context = '\n'.join([f"- {r.get('title', '')}: {r.get('content', '')}" for r in results])[:3000]
-    
-    if not context.strip():
-        context = 'No search results found.'
-    
-    prompt = f'''Based on these web search results about "{person_name}", write a concise 2-3 sentence professional summary. Focus on their current role, company, and notable achievements. If the search results don't seem relevant to this specific person, just write "Professional on LinkedIn" and nothing else. Be factual, not flowery.
+    _CACHE_DIR.mkdir(exist_ok=True)
+    cache_path.write_bytes(orjson.dumps(result))
+    return result
+
+# Cap on formatted search context fed to Gemini per person
+_CONTEXT_LIMIT = 3000
+
+_BLURB_PROMPT = '''Based on these web search results about "{name}", write a concise 2-3 sentence professional summary. Focus on their current role, company, and notable achievements. If the search results don't seem relevant to this specific person, just write "Professional on LinkedIn" and nothing else. Be factual, not flowery.
 
 Search results:
 {context}
 
 Write only the summary, nothing else:'''
 
-    response = requests.post(
+def _search_context(search_results):
+    """Format Tavily results, stopping once past the context budget."""
+    parts = []
+    size = 0
+    for r in search_results.get('results', []):
+        line = f"- {r.get('title', '')}: {r.get('content', '')}"
+        parts.append(line)
+        size += len(line) + 1
+        if size >= _CONTEXT_LIMIT:
+            break
+    context = '\n'.join(parts)[:_CONTEXT_LIMIT]
+    return context if context.strip() else 'No search results found.'
+
+def generate_blurb(search_results, person_name, api_key):
+    """Generate a professional blurb using Gemini."""
+    prompt = _BLURB_PROMPT.format(name=person_name, context=_search_context(search_results))
+
+    _GEMINI_BUCKET.acquire()
+    response = _SESSION.post(
         f'https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-lite:generateContent?key={api_key}',
         json={
             'contents': [{'parts': [{'text': prompt}]}],
@@ -158,14 +362,84 @@ Write only the summary, nothing else:'''
     except (KeyError, IndexError):
         return 'Professional on LinkedIn.'
 
+def generate_blurbs_batch(people, api_key):
+    """Generate blurbs for several people in one Gemini call.
+
+    people is a list of (conn_id, name, search_results) tuples; returns a
+    dict mapping conn_id to blurb for every person Gemini answered for.
+    """
+    sections = []
+    for conn_id, name, search_results in people:
+        sections.append(f'[id={conn_id}, name={name}]\n{_search_context(search_results)}')
+
+    prompt = f'''For each person below, write a concise 2-3 sentence professional summary based on the web search results under their entry. Focus on their current role, company, and notable achievements. If the search results don't seem relevant to that specific person, use "Professional on LinkedIn" as their summary. Be factual, not flowery.
+
+People:
+{chr(10).join(sections)}
+
+Return a JSON array of objects with "id" and "blurb" for every person.'''
+
+    _GEMINI_BUCKET.acquire()
+    response = _SESSION.post(
+        f'https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash-lite:generateContent?key={api_key}',
+        json={
+            'contents': [{'parts': [{'text': prompt}]}],
+            'generationConfig': {
+                'temperature': 0.3,
+                'maxOutputTokens': 150 * len(people),
+                'responseMimeType': 'application/json',
+                'responseSchema': {
+                    'type': 'ARRAY',
+                    'items': {
+                        'type': 'OBJECT',
+                        'properties': {
+                            'id': {'type': 'STRING'},
+                            'blurb': {'type': 'STRING'}
+                        },
+                        'required': ['id', 'blurb']
+                    }
+                }
+            }
+        },
+        timeout=60
+    )
+    response.raise_for_status()
+    data = response.json()
+
+    try:
+        items = json.loads(data['candidates'][0]['content']['parts'][0]['text'])
+        return {item['id']: item['blurb'].strip() for item in items if item.get('blurb')}
+    except (KeyError, IndexError, ValueError):
+        return {}
+
+# Cached chat context: rebuilding the full network string is O(N) string
+# work per chat turn, so it's keyed on a cheap fingerprint and reused until
+# the network changes.
+_CTX_CACHE = {'key': None, 'text': ''}
+
+def _invalidate_context_cache():
+    _CTX_CACHE['key'] = None
+
+def _network_context(connections):
+    key = (len(connections), sum(1 for c in connections if c.get('blurb')))
+    if key == _CTX_CACHE['key']:
+        return _CTX_CACHE['text']
+
+    lines = []
+    for c in connections:
+        line = f"• {c['firstName']} {c['lastName']}: {c.get('position', '')} at {c.get('company', '')}"
+        if c.get('blurb'):
+            line += f" - {c['blurb']}"
+        lines.append(line)
+
+    _CTX_CACHE['key'] = key
+    _CTX_CACHE['text'] = '\n'.join(lines)
+    return _CTX_CACHE['text']
+
 def chat_with_network(query, connections, api_key):
     """Chat about the network using Gemini."""
-    network_context = '\n'.join([
-        f"• {c['firstName']} {c['lastName']}: {c.get('position', '')} at {c.get('company', '')}" + 
-        (f" - {c['blurb']}" if c.get('blurb') else '')
-        for c in connections
-    ])
-    
+    network_context = _network_context(connections)
+
     prompt = f'''You are an assistant helping analyze a professional LinkedIn network. Below is the user's network of {len(connections)} connections.
 
 NETWORK:
@@ -175,7 +449,7 @@ USER QUERY: {query}
 
 Analyze the network and provide a helpful, specific response. Reference specific people by name when relevant. Be concise but thorough.'''
 
-    response = requests.post(
+    response = _SESSION.post(
         f'https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent?key={api_key}',
         json={
             'contents': [{'parts': [{'text': prompt}]}],
@@ -201,11 +475,22 @@ def index():
 
 @app.route('/api/data')
 def get_data():
+    """Return a page of connections; the client fetches pages lazily."""
     data = load_data()
-    return jsonify({
-        "connections": data.get("connections", []),
+    connections = data.get("connections", [])
+
+    limit = request.args.get('limit', type=int)
+    offset = request.args.get('offset', default=0, type=int)
+    page = connections[offset:offset + limit] if limit else connections[offset:]
+
+    payload = {
+        "connections": page,
+        "total": len(connections),
         "hasKeys": bool(data.get("api_keys", {}).get("tavily") and data.get("api_keys", {}).get("gemini"))
-    })
+    }
+    # orjson serializes large connection lists several times faster than
+    # jsonify's stdlib encoder
+    return app.response_class(orjson.dumps(payload), mimetype='application/json')
 
 @app.route('/api/keys', methods=['POST'])
 def save_keys():
@@ -227,22 +512,23 @@ def upload_csv():
     if not file.filename.endswith('.csv'):
         return jsonify({"error": "Must be a CSV file"}), 400
     
-    # Save temporarily and parse
-    temp_path = Path(__file__).parent / "temp_upload.csv"
-    file.save(temp_path)
-    
-    try:
-        connections = parse_linkedin_csv(temp_path)
-        if not connections:
-            return jsonify({"error": "No connections found in CSV"}), 400
-        
-        data = load_data()
-        data["connections"] = connections
-        save_data(data)
-        
-        return jsonify({"success": True, "count": len(connections)})
-    finally:
-        temp_path.unlink(missing_ok=True)
+    data = load_data()
+    # Rows whose position text is unchanged from the last import keep
+    # their category without re-running the keyword scan
+    prior = {(c["firstName"], c["lastName"], c["position"]): c["category"]
+             for c in data["connections"]}
+
+    # Parse straight off the upload stream; no temp file on disk
+    stream = io.TextIOWrapper(file.stream, encoding='utf-8-sig', newline='')
+    connections = parse_linkedin_csv(stream, prior)
+    if not connections:
+        return jsonify({"error": "No connections found in CSV"}), 400
+
+    data["connections"] = connections
+    save_data(data)
+    _invalidate_context_cache()
+
+    return jsonify({"success": True, "count": len(connections)})
 
 @app.route('/api/enrich', methods=['POST'])
 def enrich_connection():
@@ -254,21 +540,21 @@ def enrich_connection():
     if not api_keys.get("tavily") or not api_keys.get("gemini"):
         return jsonify({"error": "API keys not configured"}), 400
     
-    conn = next((c for c in data["connections"] if c["id"] == conn_id), None)
+    conn = _index(data).get(conn_id)
     if not conn:
         return jsonify({"error": "Connection not found"}), 404
     
     try:
         name = f"{conn['firstName']} {conn['lastName']}".strip()
-        query = ' '.join(filter(None, [name, conn.get('position'), conn.get('company')]))
-        
-        search_results = search_tavily(query, api_keys["tavily"])
+        search_results = search_tavily(_build_query(conn), api_keys["tavily"])
         blurb = generate_blurb(search_results, name, api_keys["gemini"])
         
         conn["blurb"] = blurb
         conn["enrichedAt"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
-        save_data(data)
-        
+        append_mutations([{"id": conn_id, "blurb": blurb, "enrichedAt": conn["enrichedAt"]}])
+        compact_if_needed(data)
+        _invalidate_context_cache()
+
         return jsonify({"success": True, "blurb": blurb})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -290,27 +576,59 @@ def enrich_batch():
     
     enriched_count = 0
     errors = []
-    
-    for conn in unenriched:
+
+    def _search_one(conn):
+        name = f"{conn['firstName']} {conn['lastName']}".strip()
+        return name, search_tavily(_build_query(conn), api_keys["tavily"])
+
+    # Fan out the Tavily searches, then coalesce everything into a single
+    # Gemini call — Gemini RPM is the bottleneck, not Tavily
+    people = []
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {executor.submit(_search_one, conn): conn for conn in unenriched}
+        for future in as_completed(futures):
+            conn = futures[future]
+            try:
+                name, search_results = future.result()
+                people.append((conn["id"], name, search_results))
+            except Exception as e:
+                name = f"{conn['firstName']} {conn['lastName']}".strip()
+                errors.append(f"{name}: {str(e)}")
+
+    if people:
         try:
-            name = f"{conn['firstName']} {conn['lastName']}".strip()
-            query = ' '.join(filter(None, [name, conn.get('position'), conn.get('company')]))
-            
-            search_results = search_tavily(query, api_keys["tavily"])
-            time.sleep(0.1)  # Small buffer
-            blurb = generate_blurb(search_results, name, api_keys["gemini"])
-            
+            blurbs = generate_blurbs_batch(people, api_keys["gemini"])
+        except Exception as e:
+            blurbs = {}
+            errors.append(f"Blurb generation: {str(e)}")
+
+        by_id = {conn["id"]: conn for conn in unenriched}
+        mutations = []
+        # One timestamp for the whole batch; the blurbs land together anyway
+        batch_ts = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        for conn_id, name, search_results in people:
+            blurb = blurbs.get(conn_id)
+            if not blurb:
+                # The batch response missed this person (unparseable or
+                # mis-keyed JSON); fall back to a single-person call so the
+                # batch always makes forward progress
+                try:
+                    blurb = generate_blurb(search_results, name, api_keys["gemini"])
+                except Exception as e:
+                    errors.append(f"{name}: {str(e)}")
+                    continue
+            conn = by_id[conn_id]
             conn["blurb"] = blurb
-            conn["enrichedAt"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            conn["enrichedAt"] = batch_ts
+            mutations.append({"id": conn_id, "blurb": blurb, "enrichedAt": batch_ts})
             enriched_count += 1
-            
-            # Rate limit: ~4 seconds between to stay under 15 RPM
-            time.sleep(4)
-        except Exception as e:
-            errors.append(f"{name}: {str(e)}")
-    
-    save_data(data)
-    
+
+        if mutations:
+            append_mutations(mutations)
+            compact_if_needed(data)
+
+    _invalidate_context_cache()
+
     remaining = len([c for c in data["connections"] if not c.get("blurb")])
     return jsonify({
         "success": True,
@@ -342,6 +660,8 @@ def chat():
 def reset_data():
     """Reset all data."""
     DATA_FILE.unlink(missing_ok=True)
+    MUTATIONS_FILE.unlink(missing_ok=True)
+    _invalidate_context_cache()
     return jsonify({"success": True})
 
 # ============ HTML TEMPLATE ============
@@ -407,12 +727,22 @@ HTML_TEMPLATE = '''
       return res.json();
     }
 
+    const PAGE_SIZE = 500;
+
     async function loadData() {
-      const data = await api('/data');
+      const data = await api(`/data?limit=${PAGE_SIZE}&offset=0`);
       state.connections = data.connections || [];
       state.hasKeys = data.hasKeys;
-      state.view = !state.hasKeys ? 'keys' : state.connections.length === 0 ? 'upload' : 'app';
+      state.view = !state.hasKeys ? 'keys' : data.total === 0 ? 'upload' : 'app';
       render();
+
+      // Fetch remaining pages lazily so first paint isn't blocked on the
+      // full network
+      for (let offset = PAGE_SIZE; offset < data.total; offset += PAGE_SIZE) {
+        const page = await api(`/data?limit=${PAGE_SIZE}&offset=${offset}`);
+        state.connections = state.connections.concat(page.connections || []);
+        render();
+      }
     }
 
     async function saveKeys() {
@@ -472,8 +802,10 @@ HTML_TEMPLATE = '''
         }
         
         state.enrichProgress.current += result.enriched;
-        
-        if (result.remaining === 0) {
+
+        // Stop when done, or when a batch made no progress and reported no
+        // errors — retrying would just spin on the same connections
+        if (result.remaining === 0 || (result.enriched === 0 && !(result.errors || []).length)) {
           state.isEnriching = false;
         }
         